@@ -35,6 +35,19 @@ def create_parser():
                        help='Running in GRAPH_MODE(0) or PYNATIVE_MODE(1) (default=0)')
     group.add_argument('--distribute', type=str2bool, nargs='?', const=True, default=False,
                        help='Run distribute (default=False)')
+    group.add_argument('--grad_bucket_mb', type=int, default=None,
+                       help='Size (MB) of the buckets that gradients are fused into for AllReduce in distributed '
+                            'training. None means using the default fusion strategy of MindSpore (default=None)')
+    group.add_argument('--allreduce_bytes_per_pack', type=int, default=None,
+                       help='If set, gradients are reduced across devices in packs of about this number of bytes, '
+                            'which can NOT be set together with `grad_bucket_mb`. None means no packing (default=None)')
+    group.add_argument('--graph_kernel', type=str2bool, nargs='?', const=True, default=False,
+                       help='Enable graph kernel fusion with jit_level O2 in GRAPH_MODE, which fuses chains of '
+                            'elementwise ops into single kernels. Needs MindSpore>=2.3 and a backend supporting '
+                            'graph kernel (default=False)')
+    group.add_argument('--compile_cache', type=str2bool, nargs='?', const=True, default=False,
+                       help='Save the compiled graphs to `ckpt_save_dir`/compile_cache and reuse them in later runs '
+                            'with the same network and input shapes to skip recompilation (default=False)')
     group.add_argument('--val_while_train', type=str2bool, nargs='?', const=True, default=False,
                        help='Verify accuracy while training (default=False)')
     group.add_argument('--val_interval', type=int, default=1,
@@ -58,6 +71,15 @@ def create_parser():
                        help='If downloading the dataset, only support Mnist, Cifar10 and Cifar100 (default=False)')
     group.add_argument('--num_parallel_workers', type=int, default=8,
                        help='Number of parallel workers (default=8)')
+    group.add_argument('--prefetch_size', type=int, default=None,
+                       help='Queue capacity of the data pipeline, i.e. the number of rows prefetched ahead of the '
+                            'training step. None means using the default of MindSpore (default=None)')
+    group.add_argument('--dataset_cache_session_id', type=int, default=None,
+                       help='Session id of a running MindSpore cache server (created by `cache_admin -g`). If set, '
+                            'the raw training images and the preprocessed validation images are cached in it, '
+                            'so they are read and preprocessed only once. None means no cache (default=None)')
+    group.add_argument('--dataset_cache_size', type=int, default=0,
+                       help='Size (MB) of the memory used by each dataset cache. 0 means unlimited (default=0)')
     group.add_argument('--shuffle', type=str2bool, nargs='?', const=True, default=True,
                        help='Whether or not to perform shuffle on the dataset (default=True)')
     group.add_argument('--num_samples', type=int, default=None,
@@ -110,6 +132,12 @@ def create_parser():
     group.add_argument('--std', type=list, default=[0.229 * 255, 0.224 * 255, 0.225 * 255],
                        help='List or tuple of mean values for each channel, '
                             'with respect to channel order (default=[0.229 * 255, 0.224 * 255, 0.225 * 255])')
+    group.add_argument('--vectorize_transform', type=str2bool, nargs='?', const=True, default=False,
+                       help='Normalize the training images batch-wise after batching instead of image by image. '
+                            'Only supported for ImageNet-style datasets (default=False)')
+    group.add_argument('--fused_transform', type=str2bool, nargs='?', const=True, default=False,
+                       help='Fuse the batch-wise normalization of `vectorize_transform` into one loop compiled by '
+                            'numba, which has to be installed (default=False)')
     group.add_argument('--crop_pct', type=float, default=0.875,
                        help='Input image center crop percent (default=0.875)')
     group.add_argument('--mixup', type=float, default=0.0,
@@ -152,6 +180,8 @@ def create_parser():
     group.add_argument('--ckpt_save_policy', type=str, default='latest_k',
                        help='Checkpoint saving strategy. The optional values is '
                             'None, "top_k" or "latest_k" (default="latest_k")')
+    group.add_argument('--async_checkpoint', type=str2bool, nargs='?', const=True, default=False,
+                       help='Save checkpoints in a background process to avoid blocking the training (default=False)')
     group.add_argument('--epoch_size', type=int, default=90,
                        help='Train epoch size (default=90)')
     group.add_argument('--dataset_sink_mode', type=str2bool, nargs='?', const=True, default=True,
@@ -232,6 +262,9 @@ def create_parser():
                             'Choice: O0 - all FP32, O1 - only cast ops in white-list to FP16, '
                             'O2 - cast all ops except for blacklist to FP16, '
                             'O3 - cast all ops to FP16. (default="O0").')
+    group.add_argument('--use_bf16', type=str2bool, nargs='?', const=True, default=False,
+                       help='Cast to BF16 instead of FP16 when amp_level is not O0. '
+                            'BF16 needs MindSpore>=2.3 and a device which supports it (default=False)')
     group.add_argument('--loss_scale_type', type=str, default='fixed',
                        choices=['fixed', 'dynamic', 'auto'],
                        help='The type of loss scale (default="fixed")')
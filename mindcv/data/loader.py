@@ -26,6 +26,8 @@ def create_loader(
     target_transform=None,
     num_parallel_workers=None,
     python_multiprocessing=False,
+    batch_transform=None,
+    cache=None,
 ):
     r"""Creates dataloader.
 
@@ -54,6 +56,10 @@ def create_loader(
             (default=None).
         python_multiprocessing (bool, optional): Parallelize Python operations with multiple worker processes. This
             option could be beneficial if the Python operation is computational heavy (default=False).
+        batch_transform (callable or None): the transformation applied on a whole batch of images after batching,
+            e.g. `BatchNormalize`, before mixup/cutmix if enabled. Default: None.
+        cache (ms.dataset.DatasetCache or None): the cache for the output of `transform`. It should only be used
+            when `transform` is deterministic, e.g. for evaluation. Default: None.
 
     Note:
         1. cutmix is now experimental (which means performance gain is not guarantee)
@@ -78,6 +84,7 @@ def create_loader(
         input_columns="image",
         num_parallel_workers=num_parallel_workers,
         python_multiprocessing=python_multiprocessing,
+        cache=cache,
     )
 
     if target_transform is None:
@@ -92,6 +99,14 @@ def create_loader(
 
     dataset = dataset.batch(batch_size=batch_size, drop_remainder=drop_remainder)
 
+    if batch_transform is not None:
+        dataset = dataset.map(
+            operations=batch_transform,
+            input_columns="image",
+            num_parallel_workers=num_parallel_workers,
+            python_multiprocessing=python_multiprocessing,
+        )
+
     if is_training:
         if (mixup + cutmix > 0.0) and batch_size > 1:
             # TODO: use mindspore vision cutmix and mixup after the confliction fixed in later release
@@ -4,6 +4,8 @@ Transform operation list
 
 import math
 
+import numpy as np
+
 from mindspore.dataset import vision
 from mindspore.dataset.vision import Inter
 
@@ -15,8 +17,16 @@ from .auto_augment import (
 )
 from .constants import DEFAULT_CROP_PCT, IMAGENET_DEFAULT_MEAN, IMAGENET_DEFAULT_STD
 
+try:
+    from numba import njit
+
+    has_numba = True
+except ImportError:
+    has_numba = False
+
 __all__ = [
     "create_transforms",
+    "BatchNormalize",
 ]
 
 
@@ -36,8 +46,13 @@ def transforms_imagenet_train(
     re_ratio=(0.3, 3.3),
     re_value=0,
     re_max_attempts=10,
+    normalize=True,
 ):
-    """Transform operation list when training on ImageNet."""
+    """Transform operation list when training on ImageNet.
+
+    If `normalize` is False, Normalize and HWC2CHW are left out and the images stay uint8 HWC,
+    so that they can be normalized batch-wise by `BatchNormalize` after batching.
+    """
     # Define map operations for training dataset
     if hasattr(Inter, interpolation.upper()):
         interpolation = getattr(Inter, interpolation.upper())
@@ -88,10 +103,13 @@ def transforms_imagenet_train(
             color_jitter = (float(color_jitter),) * 3
         trans_list += [vision.RandomColorAdjust(*color_jitter)]
 
-    trans_list += [
-        vision.Normalize(mean=mean, std=std),
-        vision.HWC2CHW(),
-    ]
+    if normalize:
+        trans_list += [
+            vision.Normalize(mean=mean, std=std),
+            vision.HWC2CHW(),
+        ]
+    elif re_prob > 0.0:
+        raise ValueError("RandomErasing is applied on normalized images, `normalize` must be True if `re_prob` > 0!")
     if re_prob > 0.0:
         trans_list.append(
             vision.RandomErasing(
@@ -112,6 +130,7 @@ def transforms_imagenet_eval(
     mean=IMAGENET_DEFAULT_MEAN,
     std=IMAGENET_DEFAULT_STD,
     interpolation="bilinear",
+    normalize=True,
 ):
     """Transform operation list when evaluating on ImageNet."""
     if isinstance(image_resize, (tuple, list)):
@@ -132,13 +151,62 @@ def transforms_imagenet_eval(
         vision.Decode(),
         vision.Resize(scale_size, interpolation=interpolation),
         vision.CenterCrop(image_resize),
-        vision.Normalize(mean=mean, std=std),
-        vision.HWC2CHW(),
     ]
+    if normalize:
+        trans_list += [
+            vision.Normalize(mean=mean, std=std),
+            vision.HWC2CHW(),
+        ]
 
     return trans_list
 
 
+if has_numba:
+
+    @njit(cache=True, nogil=True)
+    def _fused_normalize_nhwc2nchw(images, mean, inv_std):
+        """Normalize and transpose the images in a single pass, without any intermediate array.
+
+        The GIL is released, so that the parallel workers of the dataset pipeline run it concurrently.
+        """
+        b, h, w, c = images.shape
+        out = np.empty((b, c, h, w), dtype=np.float32)
+        for i in range(b):
+            for k in range(c):
+                for y in range(h):
+                    for x in range(w):
+                        out[i, k, y, x] = (images[i, y, x, k] - mean[k]) * inv_std[k]
+        return out
+
+
+class BatchNormalize:
+    """Normalize a batch of images and convert it from NHWC to NCHW.
+
+    It is the batch-wise counterpart of `vision.Normalize` followed by `vision.HWC2CHW`, applied after batching
+    so that the arithmetic is vectorized over the whole batch instead of being done image by image.
+
+    Args:
+        mean (list or tuple): Mean values for each channel. Default: IMAGENET_DEFAULT_MEAN.
+        std (list or tuple): Standard deviation values for each channel. Default: IMAGENET_DEFAULT_STD.
+        fused (bool): If True, normalization and transpose are fused into one compiled loop by `numba`,
+            which avoids the intermediate arrays. `numba` has to be installed. Default: False.
+    """
+
+    def __init__(self, mean=IMAGENET_DEFAULT_MEAN, std=IMAGENET_DEFAULT_STD, fused=False):
+        if fused and not has_numba:
+            raise ImportError("If you want fused BatchNormalize, 'numba' has to be installed!")
+        self.mean = np.array(mean, dtype=np.float32)
+        self.inv_std = 1.0 / np.array(std, dtype=np.float32)
+        self.fused = fused
+
+    def __call__(self, images):
+        if self.fused:
+            return _fused_normalize_nhwc2nchw(images, self.mean, self.inv_std)
+        images = np.subtract(images, self.mean, dtype=np.float32)
+        np.multiply(images, self.inv_std, out=images)
+        return np.ascontiguousarray(images.transpose(0, 3, 1, 2))
+
+
 def transforms_cifar(resize=224, is_training=True):
     """Transform operation list when training or evaluating on cifar."""
     trans = []
@@ -189,7 +257,8 @@ def create_transforms(
             Default: ''.
         image_resize (int): the image size after resize for adapting to network. Default: 224.
         is_training (bool): if True, augmentation will be applied if support. Default: False.
-        **kwargs: additional args parsed to `transforms_imagenet_train` and `transforms_imagenet_eval`
+        **kwargs: additional args parsed to `transforms_imagenet_train` and `transforms_imagenet_eval`.
+            For ImageNet, `normalize=False` leaves normalization to `BatchNormalize` applied after batching.
 
     Returns:
         A list of transformation operations
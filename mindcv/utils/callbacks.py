@@ -7,7 +7,7 @@ import numpy as np
 
 import mindspore as ms
 from mindspore import ParameterTuple, Tensor, ops
-from mindspore.train import Callback, SummaryRecord, load_param_into_net, save_checkpoint
+from mindspore.train import Callback, SummaryRecord, load_param_into_net
 
 from .checkpoint_manager import CheckpointManager
 from .reduce_manager import AllReduceSum
@@ -46,6 +46,7 @@ class StateMonitor(Callback):
         log_interval=100,
         rank_id=None,
         device_num=None,
+        async_checkpointer=None,
     ):
         super().__init__()
         # model
@@ -67,7 +68,10 @@ class StateMonitor(Callback):
         self.ckpt_save_interval = ckpt_save_interval
         self.ckpt_save_policy = ckpt_save_policy
         self.ckpt_keep_max = ckpt_keep_max
-        self.ckpt_manager = CheckpointManager(ckpt_save_policy=self.ckpt_save_policy)
+        self.async_checkpointer = async_checkpointer
+        self.ckpt_manager = CheckpointManager(
+            ckpt_save_policy=self.ckpt_save_policy, async_checkpointer=self.async_checkpointer
+        )
         self._need_flush_from_cache = True
         self.summary_dir = summary_dir
         self.log_interval = log_interval
@@ -195,14 +199,14 @@ class StateMonitor(Callback):
         if self.rank_id in [0, None]:
             if self.save_best_ckpt and self.best_epoch == cur_epoch:  # always save ckpt if cur epoch got best acc
                 best_ckpt_save_path = os.path.join(self.ckpt_save_dir, f"{self.model_name}_best.ckpt")
-                save_checkpoint(cb_params.train_network, best_ckpt_save_path, async_save=True)
+                self.ckpt_manager.save_checkpoint(cb_params.train_network, best_ckpt_save_path)
             if (cur_epoch % self.ckpt_save_interval == 0) or (cur_epoch == num_epochs):
                 if self._need_flush_from_cache:
                     self._flush_from_cache(cb_params)
                 # save optim for resume
                 optimizer = self._get_optimizer_from_cbp(cb_params)
                 optim_save_path = os.path.join(self.ckpt_save_dir, f"optim_{self.model_name}.ckpt")
-                save_checkpoint(optimizer, optim_save_path, async_save=True)
+                self.ckpt_manager.save_checkpoint(optimizer, optim_save_path)
                 # keep checkpoint files number equal max number.
                 ckpt_save_path = os.path.join(self.ckpt_save_dir, f"{self.model_name}-{cur_epoch}_{cur_batch}.ckpt")
                 _logger.info(f"Saving model to {ckpt_save_path}")
@@ -244,6 +248,8 @@ class StateMonitor(Callback):
         self.summary_record.record(cur_step)
 
     def on_train_end(self, run_context):
+        if self.async_checkpointer is not None:
+            self.async_checkpointer.close()
         _logger.info("Finish training!")
         if self.dataset_val is not None:
             _logger.info(
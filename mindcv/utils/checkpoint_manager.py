@@ -1,7 +1,9 @@
 """checkpoint manager """
 import logging
+import multiprocessing as mp
 import os
 import stat
+from queue import Empty, Full
 
 import numpy as np
 
@@ -10,6 +12,108 @@ import mindspore as ms
 _logger = logging.getLogger(__name__)
 
 
+def _checkpoint_worker(queue, saved_queue):
+    """Serialize the received parameters to disk until the sentinel `None` arrives.
+
+    The path of each handled checkpoint is reported back through `saved_queue`, even if the saving failed,
+    so that the training process never waits for a checkpoint that will not come.
+    """
+    while True:
+        item = queue.get()
+        if item is None:
+            break
+        save_path, param_list = item
+        try:
+            ms.save_checkpoint([{"name": name, "data": ms.Tensor(data)} for name, data in param_list], save_path)
+        except Exception:  # keep serving the following checkpoints
+            _logger.exception(f"Failed to save checkpoint to {save_path}.")
+        finally:
+            saved_queue.put(save_path)
+
+
+class AsyncCheckpointer:
+    """
+    Save checkpoints in a long-lived background process.
+    The parameters are copied to host memory on the calling thread, then handed over to the child process
+    which serializes them to disk, so that the training is not blocked by the disk writing.
+    At most `max_pending` checkpoints wait in the queue, so `save` blocks if the disk writing falls behind,
+    instead of piling up host copies of the parameters.
+
+    Note:
+        Only the master process saves checkpoints and neither side runs any collective communication,
+        so checkpointing never shares the communicator used for the gradient reduction.
+
+    Args:
+        max_pending (int): Max number of checkpoints waiting to be written. It should hold all the checkpoints
+            saved at once, e.g. the best, the optimizer and the latest ones. Default: 3.
+    """
+
+    def __init__(self, max_pending=3):
+        ctx = mp.get_context("spawn")
+        self._queue = ctx.Queue(maxsize=max_pending)
+        self._saved_queue = ctx.Queue()
+        self._process = ctx.Process(target=_checkpoint_worker, args=(self._queue, self._saved_queue), daemon=True)
+        self._process.start()
+        # the paths enqueued but not yet reported as handled by the background process
+        self._pending = []
+        # the parameters to save of each network, collected at its first save and reused afterwards
+        self._save_plans = {}
+
+    def _get_save_plan(self, network):
+        key = id(network)
+        if key not in self._save_plans:
+            self._save_plans[key] = [(param.name, param) for param in network.get_parameters()]
+        return self._save_plans[key]
+
+    def _check_alive(self):
+        if not self._process.is_alive():
+            raise RuntimeError(
+                f"The checkpoint process exited unexpectedly with code {self._process.exitcode}, "
+                f"checkpoints not saved: {self._pending}"
+            )
+
+    def _put(self, item):
+        while True:
+            self._check_alive()
+            try:
+                self._queue.put(item, timeout=1.0)
+                return
+            except Full:
+                pass
+
+    def _collect_saved(self, block=False):
+        """Drop the checkpoints reported as handled from the pending list."""
+        try:
+            save_path = self._saved_queue.get(timeout=1.0) if block else self._saved_queue.get_nowait()
+            while True:
+                self._pending.remove(save_path)
+                save_path = self._saved_queue.get_nowait()
+        except Empty:
+            pass
+
+    def save(self, network, save_path):
+        """Copy the parameters of `network` to host and enqueue them to be saved to `save_path`."""
+        param_list = [(name, param.asnumpy()) for name, param in self._get_save_plan(network)]
+        self._put((save_path, param_list))
+        self._pending.append(save_path)
+
+    def wait_until_saved(self, save_path):
+        """Block until the checkpoint `save_path` is handled. Return immediately if it is not pending."""
+        self._collect_saved()
+        while save_path in self._pending:
+            self._check_alive()
+            self._collect_saved(block=True)
+
+    def close(self):
+        """Wait until all the enqueued checkpoints are saved, then stop the background process."""
+        if self._process.is_alive():
+            self._put(None)
+            self._process.join()
+        self._collect_saved()
+        if self._pending:
+            _logger.warning(f"The checkpoint process exited before saving: {self._pending}")
+
+
 class CheckpointManager:
     """
     Manage checkpoint files according to ckpt_save_policy of checkpoint.
@@ -17,11 +121,14 @@ class CheckpointManager:
         ckpt_save_policy (str): Checkpoint saving strategy. The optional values is None, "top_k" or "latest_k".
         None means to save each checkpoint, top_k means to save K checkpoints with the highest accuracy,
         and latest_k means saving the latest K checkpoint. Default: None.
+        async_checkpointer (AsyncCheckpointer): If given, checkpoints are saved in its background process.
+            Default: None.
     """
 
-    def __init__(self, ckpt_save_policy=None):
+    def __init__(self, ckpt_save_policy=None, async_checkpointer=None):
         self._ckpoint_filelist = []
         self.ckpt_save_policy = ckpt_save_policy
+        self.async_checkpointer = async_checkpointer
 
     @property
     def ckpoint_filelist(self):
@@ -46,6 +153,9 @@ class CheckpointManager:
 
     def remove_ckpoint_file(self, file_name):
         """Remove the specified checkpoint file from this checkpoint manager and also from the directory."""
+        if self.async_checkpointer is not None:
+            # the file may be still waiting to be written by the background process
+            self.async_checkpointer.wait_until_saved(file_name)
         try:
             os.chmod(file_name, stat.S_IWRITE)
             os.remove(file_name)
@@ -56,9 +166,13 @@ class CheckpointManager:
 
     def remove_oldest_ckpoint_file(self):
         """Remove the oldest checkpoint file from this checkpoint manager and also from the directory."""
-        ckpoint_files = sorted(self._ckpoint_filelist, key=os.path.getmtime)
-        self.remove_ckpoint_file(ckpoint_files[0])
-        self._ckpoint_filelist.remove(ckpoint_files[0])
+        if self.async_checkpointer is not None:
+            # pending files have no mtime yet, the list is kept in saving order
+            oldest_file = self._ckpoint_filelist[0]
+        else:
+            oldest_file = sorted(self._ckpoint_filelist, key=os.path.getmtime)[0]
+        self.remove_ckpoint_file(oldest_file)
+        self._ckpoint_filelist.remove(oldest_file)
 
     def keep_one_ckpoint_per_minutes(self, minutes, cur_time):
         """Only keep the latest one ckpt file per minutes, remove other files generated in [last_time, cur_time]."""
@@ -79,6 +193,13 @@ class CheckpointManager:
                 continue
             self.remove_ckpoint_file(mv_file)
 
+    def save_checkpoint(self, network, save_path=""):
+        """Save a single checkpoint, in the background process if async checkpointing is enabled."""
+        if self.async_checkpointer is not None:
+            self.async_checkpointer.save(network, save_path)
+        else:
+            ms.save_checkpoint(network, save_path, async_save=True)
+
     def top_K_checkpoint(self, network, K=10, metric=None, save_path=""):
         """Save and return Top K checkpoint address and accuracy."""
         last_file = self._ckpoint_filelist[-1] if self._ckpoint_filelist else None
@@ -93,7 +214,7 @@ class CheckpointManager:
                 for d in to_delete:
                     self.remove_ckpoint_file(d[0])
                 self._ckpoint_filelist = self._ckpoint_filelist[:delete]
-            ms.save_checkpoint(network, save_path, async_save=True)
+            self.save_checkpoint(network, save_path)
             self._ckpoint_filelist.append((save_path, float(metric)))
             self._ckpoint_filelist = sorted(self._ckpoint_filelist, key=lambda x: x[1], reverse=True)
 
@@ -101,13 +222,13 @@ class CheckpointManager:
         """Save latest K checkpoint."""
         if K and 0 < K <= self.ckpoint_num:
             self.remove_oldest_ckpoint_file()
-        ms.save_checkpoint(network, save_path, async_save=True)
+        self.save_checkpoint(network, save_path)
         self._ckpoint_filelist.append(save_path)
 
     def save_ckpoint(self, network, num_ckpt=10, metric=None, save_path=""):
         """Save checkpoint according to different save strategy."""
         if self.ckpt_save_policy is None:
-            ms.save_checkpoint(network, save_path, async_save=True)
+            self.save_checkpoint(network, save_path)
         elif self.ckpt_save_policy == "top_k":
             if metric is None:
                 raise ValueError(f"The expected 'metric' is not None, but got: {metric}.")
@@ -163,6 +163,7 @@ class TrainStep(nn.TrainOneStepWithLossScaleCell):
                     loss = F.depend(loss, self.optimizer(grads))
         else:  # scale_sense = loss_scale: Tensor --> TrainOneStepCell.construct
             if self.accumulate_grad:
+                # grads are not reduced here, GradientAccumulation only syncs them at the last micro-step
                 loss = self.gradient_accumulation(loss, grads)
             else:
                 grads = self.grad_reducer(grads)
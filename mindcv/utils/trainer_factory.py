@@ -1,5 +1,5 @@
 import logging
-from typing import Union
+from typing import Optional, Union
 
 import mindspore as ms
 from mindspore import Tensor, context, nn
@@ -39,6 +39,19 @@ def require_customized_train_step(ema: bool = False, clip_grad: bool = False, gr
     return False
 
 
+def _set_comm_fusion_by_size(params, bytes_per_pack):
+    """Assign fusion ids to parameters, so that their gradients are reduced in packs of about `bytes_per_pack`."""
+    fusion_id = 1
+    pack_bytes = 0
+    # gradients are produced in the reversed order of parameters during back propagation
+    for param in reversed(params):
+        param.comm_fusion = fusion_id
+        pack_bytes += param.size * param.itemsize
+        if pack_bytes >= bytes_per_pack:
+            fusion_id += 1
+            pack_bytes = 0
+
+
 def create_trainer(
     network: nn.Cell,
     loss: nn.Cell,
@@ -53,6 +66,8 @@ def create_trainer(
     clip_grad: bool = False,
     clip_value: float = 15.0,
     gradient_accumulation_steps: int = 1,
+    allreduce_bytes_per_pack: Optional[int] = None,
+    use_bf16: bool = False,
 ):
     """Create Trainer.
 
@@ -70,6 +85,9 @@ def create_trainer(
         clip_grad: whether to gradient clip.
         clip_value: The value at which to clip gradients.
         gradient_accumulation_steps: Accumulate the gradients of n batches before update.
+        allreduce_bytes_per_pack: If set, gradients are reduced across devices in packs of about this number
+            of bytes, so that the reduction of the packs can overlap with the computation. Default: None.
+        use_bf16: Whether to cast to bfloat16 instead of float16 in auto mixing precision. Default: False.
 
     Returns:
         mindspore.Model
@@ -84,13 +102,26 @@ def create_trainer(
     if gradient_accumulation_steps < 1:
         raise ValueError("`gradient_accumulation_steps` must be >= 1!")
 
+    if allreduce_bytes_per_pack is not None:
+        if allreduce_bytes_per_pack <= 0:
+            raise ValueError("`allreduce_bytes_per_pack` must be > 0!")
+        _set_comm_fusion_by_size(optimizer.parameters, allreduce_bytes_per_pack)
+
+    amp_kwargs = dict(dtype=ms.bfloat16) if use_bf16 else dict()
+
     if not require_customized_train_step(ema, clip_grad, gradient_accumulation_steps):
+        if use_bf16 and amp_level != "O0":
+            # mindspore.Model always casts to float16, so we cast the network by ourselves
+            network = ms.amp.auto_mixed_precision(network, amp_level=amp_level, **amp_kwargs)
+            model_amp_level = "O0"
+        else:
+            model_amp_level = amp_level
         mindspore_kwargs = dict(
             network=network,
             loss_fn=loss,
             optimizer=optimizer,
             metrics=metrics,
-            amp_level=amp_level,
+            amp_level=model_amp_level,
         )
         if loss_scale_type.lower() == "fixed":
             mindspore_kwargs["loss_scale_manager"] = FixedLossScaleManager(
@@ -112,7 +143,7 @@ def create_trainer(
         model = Model(**mindspore_kwargs)
     else:  # require customized train step
         net_with_loss = nn.WithLossCell(network, loss)
-        ms.amp.auto_mixed_precision(net_with_loss, amp_level=amp_level)
+        ms.amp.auto_mixed_precision(net_with_loss, amp_level=amp_level, **amp_kwargs)
         train_step_kwargs = dict(
             network=net_with_loss,
             optimizer=optimizer,
@@ -1,14 +1,18 @@
 import collections
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from time import time
 
 sys.path.append(".")
 
+import numpy as np
 import pytest
 
 import mindspore as ms
+from mindspore.dataset import vision
 
-from mindcv.data import create_dataset, create_loader, create_transforms, get_dataset_download_root
+from mindcv.data import BatchNormalize, create_dataset, create_loader, create_transforms, get_dataset_download_root
 from mindcv.utils.download import DownLoad
 
 
@@ -218,5 +222,48 @@ def test_repeated_aug():
                 print("Epoch: ", epoch, "Batch: ", batch, "Rank: ", rank_id, "Label: ", label[:4])
 
 
+def test_batch_normalize():
+    mean = [0.485 * 255, 0.456 * 255, 0.406 * 255]
+    std = [0.229 * 255, 0.224 * 255, 0.225 * 255]
+    images = np.random.randint(0, 256, size=(4, 32, 32, 3), dtype=np.uint8)
+
+    batch_out = BatchNormalize(mean=mean, std=std)(images)
+    normalize, hwc2chw = vision.Normalize(mean=mean, std=std), vision.HWC2CHW()
+    sample_out = np.stack([hwc2chw(normalize(image)) for image in images])
+
+    assert batch_out.shape == (4, 3, 32, 32)
+    assert batch_out.dtype == np.float32
+    assert np.allclose(batch_out, sample_out, atol=1e-5), "BatchNormalize is NOT consistent with Normalize"
+
+
+def test_batch_normalize_fused():
+    pytest.importorskip("numba")
+    images = np.random.randint(0, 256, size=(4, 32, 32, 3), dtype=np.uint8)
+
+    fused_out = BatchNormalize(fused=True)(images)
+    assert fused_out.shape == (4, 3, 32, 32)
+    assert np.allclose(fused_out, BatchNormalize()(images), atol=1e-5), "fused BatchNormalize is NOT correct"
+
+
+
+def test_batch_normalize_fused_concurrent():
+    pytest.importorskip("numba")
+    # the batch map is called from `num_parallel_workers` threads of the dataset pipeline
+    num_workers = 8
+    batches = [np.random.randint(0, 256, size=(16, 224, 224, 3), dtype=np.uint8) for _ in range(2 * num_workers)]
+
+    def run_concurrently(batch_normalize):
+        batch_normalize(batches[0])  # warm up, e.g. compile the fused kernel
+        start = time()
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            outputs = list(executor.map(batch_normalize, batches))
+        return time() - start, outputs
+
+    numpy_time, numpy_outputs = run_concurrently(BatchNormalize())
+    fused_time, fused_outputs = run_concurrently(BatchNormalize(fused=True))
+    for numpy_out, fused_out in zip(numpy_outputs, fused_outputs):
+        assert np.allclose(numpy_out, fused_out, atol=1e-5), "fused BatchNormalize is NOT correct"
+    assert fused_time <= numpy_time, f"fused BatchNormalize is slower: {fused_time:.3f}s vs {numpy_time:.3f}s"
+
 if __name__ == "__main__":
     test_repeated_aug()
@@ -14,7 +14,8 @@ from mindspore.nn import TrainOneStepCell, WithLossCell
 
 from mindcv.loss import create_loss
 from mindcv.optim import create_optimizer
-from mindcv.utils import CheckpointManager
+from mindcv.utils import AsyncCheckpointer, CheckpointManager
+from mindcv.utils.trainer_factory import _set_comm_fusion_by_size
 
 ms.set_seed(1)
 np.random.seed(1)
@@ -87,3 +88,61 @@ def test_checkpoint_manager(mode, ckpt_save_policy):
         ckpoint_filelist = manager.save_ckpoint(network, num_ckpt=2, metric=acc, save_path=save_path)
 
     assert len(ckpoint_filelist) == 2, "num of checkpoints is NOT correct"
+
+
+@pytest.mark.parametrize("ckpt_save_policy", ["top_k", "latest_k"])
+def test_async_checkpointer(tmp_path, ckpt_save_policy):
+    network = SimpleCNN(in_channels=1, num_classes=10)
+    checkpointer = AsyncCheckpointer()
+    manager = CheckpointManager(ckpt_save_policy=ckpt_save_policy, async_checkpointer=checkpointer)
+    for t in range(4):
+        save_path = str(tmp_path / f"network_{t + 1}.ckpt")
+        ckpoint_filelist = manager.save_ckpoint(network, num_ckpt=2, metric=t, save_path=save_path)
+    checkpointer.close()
+
+    if ckpt_save_policy == "top_k":
+        ckpoint_filelist = [ckpt for ckpt, _ in ckpoint_filelist]
+    expected = [str(tmp_path / name) for name in ["network_3.ckpt", "network_4.ckpt"]]
+    assert sorted(ckpoint_filelist) == expected, "managed checkpoints are NOT correct"
+    assert sorted(str(tmp_path / name) for name in os.listdir(tmp_path)) == expected, "saved files are NOT correct"
+
+    param_dict = ms.load_checkpoint(expected[-1])
+    for param in network.get_parameters():
+        assert np.allclose(param_dict[param.name].asnumpy(), param.asnumpy()), "saved parameters are NOT correct"
+
+
+def test_async_checkpointer_save_failure(tmp_path):
+    network = SimpleCNN(in_channels=1, num_classes=10)
+    checkpointer = AsyncCheckpointer()
+    # a directory in the way makes the saving fail in the background process
+    failed_path = str(tmp_path / "network_1.ckpt")
+    os.makedirs(failed_path)
+    checkpointer.save(network, failed_path)
+    checkpointer.wait_until_saved(failed_path)  # must not hang on a failed checkpoint
+
+    save_path = str(tmp_path / "network_2.ckpt")
+    checkpointer.save(network, save_path)
+    checkpointer.close()
+    assert os.path.isdir(failed_path)
+    assert os.path.isfile(save_path), "the checkpoint process does NOT survive a failed saving"
+
+
+def test_async_checkpointer_process_exited(tmp_path):
+    network = SimpleCNN(in_channels=1, num_classes=10)
+    checkpointer = AsyncCheckpointer()
+    checkpointer._process.terminate()
+    checkpointer._process.join()
+    with pytest.raises(RuntimeError):
+        checkpointer.save(network, str(tmp_path / "network_1.ckpt"))
+
+
+def test_set_comm_fusion_by_size():
+    network = SimpleCNN(in_channels=1, num_classes=10)
+    params = network.trainable_params()
+    # float32 sizes: conv1.weight 600B, conv2.weight 9600B, fc.weight 16000B, fc.bias 40B
+    assert [param.name for param in params] == ["conv1.weight", "conv2.weight", "fc.weight", "fc.bias"]
+    _set_comm_fusion_by_size(params, bytes_per_pack=10000)
+
+    # packs are filled in reversed order: [fc.bias, fc.weight] -> 1, [conv2.weight, conv1.weight] -> 2
+    fusion_ids = {param.name: param.comm_fusion for param in params}
+    assert fusion_ids == {"fc.bias": 1, "fc.weight": 1, "conv2.weight": 2, "conv1.weight": 2}
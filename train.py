@@ -3,16 +3,15 @@ import logging
 import os
 
 import mindspore as ms
-from mindspore import Tensor
 from mindspore.communication import get_group_size, get_rank, init
 
-from mindcv.data import create_dataset, create_loader, create_transforms
+from mindcv.data import BatchNormalize, create_dataset, create_loader, create_transforms
 from mindcv.loss import create_loss
 from mindcv.models import create_model
 from mindcv.optim import create_optimizer
 from mindcv.scheduler import create_scheduler
 from mindcv.utils import (
-    AllReduceSum,
+    AsyncCheckpointer,
     StateMonitor,
     create_trainer,
     get_metrics,
@@ -29,7 +28,18 @@ logger = logging.getLogger("mindcv.train")
 def train(args):
     """main train function"""
 
+    assert (
+        args.grad_bucket_mb is None or args.allreduce_bytes_per_pack is None
+    ), "grad_bucket_mb and allreduce_bytes_per_pack can NOT be set together."
     ms.set_context(mode=args.mode)
+    if args.graph_kernel:
+        ms.set_context(
+            jit_config={"jit_level": "O2"},
+            enable_graph_kernel=True,
+            graph_kernel_flags="--enable_parallel_fusion=true",
+        )
+    if args.compile_cache:
+        ms.set_context(enable_compile_cache=True, compile_cache_path=os.path.join(args.ckpt_save_dir, "compile_cache"))
     if args.distribute:
         init()
         device_num = get_group_size()
@@ -40,6 +50,9 @@ def train(args):
             gradients_mean=True,
             # we should but cannot set parameter_broadcast=True, which will cause error on gpu.
         )
+        if args.grad_bucket_mb is not None:
+            # fuse gradients into buckets of fixed size so that AllReduce overlaps with the backward pass
+            ms.set_auto_parallel_context(comm_fusion={"allreduce": {"mode": "size", "config": args.grad_bucket_mb}})
     else:
         device_num = None
         rank_id = None
@@ -51,6 +64,17 @@ def train(args):
         "and setup logger by `set_logger(..., color=True)`"
     )
 
+    if args.prefetch_size is not None:
+        ms.dataset.config.set_prefetch_size(args.prefetch_size)
+
+    if args.dataset_cache_session_id is not None:
+        # only the raw images are cached for training, since the augmentations are redrawn at each epoch
+        cache_train = ms.dataset.DatasetCache(session_id=args.dataset_cache_session_id, size=args.dataset_cache_size)
+        cache_eval = ms.dataset.DatasetCache(session_id=args.dataset_cache_session_id, size=args.dataset_cache_size)
+    else:
+        cache_train = None
+        cache_eval = None
+
     # create dataset
     dataset_train = create_dataset(
         name=args.dataset,
@@ -63,6 +87,7 @@ def train(args):
         num_parallel_workers=args.num_parallel_workers,
         download=args.dataset_download,
         num_aug_repeats=args.aug_repeats,
+        cache=cache_train,
     )
 
     if args.num_classes is None:
@@ -71,6 +96,8 @@ def train(args):
         num_classes = args.num_classes
 
     # create transforms
+    if args.vectorize_transform:
+        assert args.dataset.lower() in ("imagenet", ""), "vectorize_transform only supports ImageNet-style datasets."
     transform_list = create_transforms(
         dataset_name=args.dataset,
         is_training=True,
@@ -89,7 +116,12 @@ def train(args):
         re_ratio=args.re_ratio,
         re_value=args.re_value,
         re_max_attempts=args.re_max_attempts,
+        normalize=not args.vectorize_transform,
     )
+    if args.vectorize_transform:
+        batch_transform = BatchNormalize(mean=args.mean, std=args.std, fused=args.fused_transform)
+    else:
+        batch_transform = None
 
     # load dataset
     loader_train = create_loader(
@@ -103,6 +135,7 @@ def train(args):
         num_classes=num_classes,
         transform=transform_list,
         num_parallel_workers=args.num_parallel_workers,
+        batch_transform=batch_transform,
     )
 
     if args.val_while_train:
@@ -133,22 +166,22 @@ def train(args):
             is_training=False,
             transform=transform_list_eval,
             num_parallel_workers=args.num_parallel_workers,
+            cache=cache_eval,
         )
         # validation dataset count
         eval_count = dataset_eval.get_dataset_size()
         if args.distribute:
-            all_reduce = AllReduceSum()
-            eval_count = all_reduce(Tensor(eval_count, ms.int32))
+            eval_count *= device_num
     else:
         loader_eval = None
         eval_count = None
 
     num_batches = loader_train.get_dataset_size()
     # Train dataset count
+    # each shard holds the same number of samples (the samplers pad the dataset), no need to all-reduce them
     train_count = dataset_train.get_dataset_size()
     if args.distribute:
-        all_reduce = AllReduceSum()
-        train_count = all_reduce(Tensor(train_count, ms.int32))
+        train_count *= device_num
 
     # create model
     network = create_model(
@@ -162,7 +195,11 @@ def train(args):
         ema=args.ema,
     )
 
-    num_params = sum([param.size for param in network.get_parameters()])
+    # only the master process reports the model size
+    if rank_id in [0, None]:
+        num_params = sum(param.size for param in network.get_parameters())
+    else:
+        num_params = None
 
     # create loss
     loss = create_loss(
@@ -236,6 +273,8 @@ def train(args):
         clip_grad=args.clip_grad,
         clip_value=args.clip_value,
         gradient_accumulation_steps=args.gradient_accumulation_steps,
+        allreduce_bytes_per_pack=args.allreduce_bytes_per_pack,
+        use_bf16=args.use_bf16,
     )
 
     # callback
@@ -244,14 +283,22 @@ def train(args):
     begin_step = 0
     begin_epoch = 0
     if args.ckpt_path != "":
-        begin_step = optimizer.global_step.asnumpy()[0]
-        begin_epoch = args.ckpt_path.split("/")[-1].split("-")[1].split("_")[0]
-        begin_epoch = int(begin_epoch)
+        # checkpoints are saved as {model_name}-{epoch}_{batch}.ckpt, see StateMonitor
+        epoch_batch = args.ckpt_path.split("/")[-1].split("-")[1].split("_")
+        begin_epoch = int(epoch_batch[0])
+        try:
+            begin_step = (begin_epoch - 1) * num_batches + int(epoch_batch[1].split(".")[0])
+        except (IndexError, ValueError):  # fallback to the optimizer step, which needs a device-to-host sync
+            begin_step = int(optimizer.global_step.asnumpy()[0])
 
     summary_dir = f"./{args.ckpt_save_dir}/summary"
     assert (
         args.ckpt_save_policy != "top_k" or args.val_while_train is True
     ), "ckpt_save_policy is top_k, val_while_train must be True."
+    if args.async_checkpoint and rank_id in [0, None]:
+        async_checkpointer = AsyncCheckpointer()
+    else:
+        async_checkpointer = None
     state_cb = StateMonitor(
         trainer,
         model_name=args.model,
@@ -269,9 +316,16 @@ def train(args):
         log_interval=args.log_interval,
         rank_id=rank_id,
         device_num=device_num,
+        async_checkpointer=async_checkpointer,
     )
 
     callbacks = [state_cb]
+    amp_msg = args.amp_level
+    if args.use_bf16:
+        if args.amp_level != "O0":
+            amp_msg += "(BF16)"
+        else:
+            logger.warning("`use_bf16` has no effect when `amp_level` is O0.")
     essential_cfg_msg = "\n".join(
         [
             "Essential Experiment Configurations:",
@@ -287,18 +341,19 @@ def train(args):
             f"MixUp: {args.mixup}",
             f"CutMix: {args.cutmix}",
             f"Model: {args.model}",
-            f"Model parameters: {num_params}",
             f"Number of epochs: {args.epoch_size}",
             f"Optimizer: {args.opt}",
             f"Learning rate: {args.lr}",
             f"LR Scheduler: {args.scheduler}",
             f"Momentum: {args.momentum}",
             f"Weight decay: {args.weight_decay}",
-            f"Auto mixed precision: {args.amp_level}",
+            f"Auto mixed precision: {amp_msg}",
             f"Loss scale: {args.loss_scale}({args.loss_scale_type})",
         ]
     )
     logger.info(essential_cfg_msg)
+    if rank_id in [0, None]:
+        logger.info(f"Model parameters: {num_params}")
     save_args(args, os.path.join(args.ckpt_save_dir, f"{args.model}.yaml"), rank_id)
 
     if args.ckpt_path != "":
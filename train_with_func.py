@@ -27,11 +27,6 @@ except ImportError:
     from mindspore import ms_function as jit
 
 logger = logging.getLogger("train")
-logger.setLevel(logging.INFO)
-h1 = logging.StreamHandler()
-formatter1 = logging.Formatter("%(message)s")
-logger.addHandler(h1)
-h1.setFormatter(formatter1)
 
 
 def train(args):
@@ -56,6 +51,13 @@ def train(args):
 
     set_seed(args.seed, rank_id)
 
+    # only the master process prints the log, and the handler is added once even if train() is called repeatedly
+    if rank_id in [None, 0] and not logger.handlers:
+        logger.setLevel(logging.INFO)
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+
     # create dataset
     dataset_train = create_dataset(
         name=args.dataset,
@@ -142,13 +144,14 @@ def train(args):
         # validation dataset count
         eval_count = dataset_eval.get_dataset_size()
         if args.distribute:
-            eval_count = dist_sum(Tensor(eval_count, ms.int32))
+            eval_count *= device_num
 
     num_batches = loader_train.get_dataset_size()
     # Train dataset count
+    # each shard holds the same number of samples (the samplers pad the dataset), no need to all-reduce them
     train_count = dataset_train.get_dataset_size()
     if args.distribute:
-        train_count = dist_sum(Tensor(train_count, ms.int32))
+        train_count *= device_num
 
     # create model
     network = create_model(
@@ -161,7 +164,9 @@ def train(args):
         checkpoint_path=args.ckpt_path,
     )
 
-    num_params = sum([param.size for param in network.get_parameters()])
+    # only the master process logs the model size
+    if rank_id in [None, 0]:
+        num_params = sum(param.size for param in network.get_parameters())
 
     # create loss
     ms.amp.auto_mixed_precision(network, amp_level=args.amp_level)